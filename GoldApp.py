@@ -1,6 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import sqlite3
+import json
+import re
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from fpdf import FPDF
 import os
@@ -8,6 +12,59 @@ import shutil
 import webbrowser
 
 class GoldShopApp:
+    # Statements run on every refresh, built once so each call passes the
+    # identical string and sqlite3's statement cache reuses the compiled plan
+    _SQL_ORDER_ROWS = '''SELECT orders.id, clients.name, orders.description, 
+                         orders.estimated_weight, orders.actual_weight, orders.purity,
+                         orders.order_date, orders.delivery_date, orders.status
+                         FROM orders
+                         LEFT JOIN clients ON orders.client_id = clients.id'''
+    _SQL_ORDERS_ORDER = " ORDER BY orders.order_date DESC, orders.id DESC"
+    _SQL_LOAD_ORDERS = _SQL_ORDER_ROWS + _SQL_ORDERS_ORDER
+    _SQL_SEARCH_ORDERS_FTS = (_SQL_ORDER_ROWS
+                              + " WHERE orders.id IN (SELECT rowid FROM orders_fts WHERE orders_fts MATCH ?)"
+                              + _SQL_ORDERS_ORDER)
+    _SQL_SEARCH_ORDERS_LIKE = (_SQL_ORDER_ROWS
+                               + " WHERE clients.name LIKE ? OR orders.description LIKE ? OR orders.status LIKE ?"
+                               + _SQL_ORDERS_ORDER)
+    _SQL_ORDER_ROW = _SQL_ORDER_ROWS + " WHERE orders.id = ?"
+    
+    _SQL_INVENTORY_ROWS = '''SELECT inventory.id, inventory.transaction_type, inventory.weight, inventory.purity, 
+                             inventory.price_per_gm, inventory.date, inventory.notes, clients.name
+                             FROM inventory
+                             LEFT JOIN clients ON inventory.client_id = clients.id'''
+    # The id tiebreak keeps pages stable between same-day transactions
+    _SQL_LOAD_INVENTORY = _SQL_INVENTORY_ROWS + " ORDER BY inventory.date DESC, inventory.id DESC"
+    _SQL_INVENTORY_ROW = _SQL_INVENTORY_ROWS + " WHERE inventory.id = ?"
+    
+    _ORDER_ITEM_COLUMNS = ("order_id", "description", "weight", "purity", "rate", "amount")
+    
+    # Exactly the clients tree's columns, in its order
+    _SQL_CLIENT_ROWS = "SELECT id, name, phone, address, created_date FROM clients"
+    _SQL_LOAD_CLIENTS = _SQL_CLIENT_ROWS + " ORDER BY name"
+    _SQL_SEARCH_CLIENTS = (_SQL_CLIENT_ROWS
+                           + " WHERE name LIKE ? OR phone LIKE ? OR address LIKE ?"
+                           + " ORDER BY name")
+    _SQL_SEARCH_CLIENTS_PREFIX = _SQL_CLIENT_ROWS + " WHERE name LIKE ? ORDER BY name"
+    _SQL_SEARCH_CLIENTS_FTS = (_SQL_CLIENT_ROWS
+                               + " WHERE id IN (SELECT rowid FROM clients_fts WHERE clients_fts MATCH ?)"
+                               + " ORDER BY name")
+    _SQL_CLIENT_BY_ID = _SQL_CLIENT_ROWS + " WHERE id = ?"
+    _SQL_INSERT_CLIENT = '''INSERT INTO clients 
+                            (name, phone, address, created_date)
+                            VALUES (?, ?, ?, ?)'''
+    _SQL_UPDATE_CLIENT = '''UPDATE clients SET
+                            name = ?,
+                            phone = ?,
+                            address = ?
+                            WHERE id = ?'''
+    _SQL_DELETE_CLIENT = "DELETE FROM clients WHERE id = ?"
+    _SQL_CLIENT_HAS_ORDERS = "SELECT 1 FROM orders WHERE client_id = ? LIMIT 1"
+    _SQL_CLIENT_HAS_INVENTORY = "SELECT 1 FROM inventory WHERE client_id = ? LIMIT 1"
+    _SQL_INVOICE_ORDERS = '''SELECT orders.id, clients.name, orders.description, orders.order_date
+                             FROM orders LEFT JOIN clients ON orders.client_id = clients.id
+                             ORDER BY orders.order_date DESC'''
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Management System ❤️ Created by Enzoha6ks ❤️")
@@ -15,7 +72,23 @@ class GoldShopApp:
         
         # Setup database
         self.db_path = "gold.db"
+        self._page_size = 200
+        self._tree_pages = {}
+        self._dashboard_cache = None
+        self._cache_dirty = {"orders": True, "inventory": True, "clients": True, "rates": True}
+        self._ui_queue = queue.Queue()
+        self._pdf_pool = ThreadPoolExecutor(max_workers=2)
+        self._db_pool = ThreadPoolExecutor(max_workers=1)
+        self._db_reader = None
+        self._clients_cache = None
+        self._latest_rates = None
+        self._invoice_orders_cache = None
+        self._order_search_after = None
+        self._client_search_after = None
+        self._client_search_shown = ""
+        self.conn = self._connect(check_same_thread=False)
         self.setup_database()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Style configuration
         self.setup_styles()
@@ -32,6 +105,35 @@ class GoldShopApp:
         
         # Center the window
         self.center_window()
+        
+        # Pick up results from background workers
+        self._poll_ui_queue()
+    
+    def _poll_ui_queue(self):
+        """Run callbacks queued by worker threads on the Tk thread"""
+        try:
+            while True:
+                try:
+                    callback, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback(*args)
+                except Exception as e:
+                    # One failing callback must not drop the ones queued after it
+                    messagebox.showerror("Error", str(e))
+        finally:
+            # Keep polling even if reporting an error fails
+            self._poll_after_id = self.root.after(100, self._poll_ui_queue)
+    
+    def on_close(self):
+        """Close the database connection and exit"""
+        self.root.after_cancel(self._poll_after_id)
+        self._pdf_pool.shutdown(wait=False)
+        self._db_pool.submit(self._close_db_reader)
+        self._db_pool.shutdown(wait=False)
+        self.conn.close()
+        self.root.destroy()
     
     def center_window(self):
         """Center the window on screen"""
@@ -42,6 +144,166 @@ class GoldShopApp:
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
     
+    def _mark_dirty(self, *tables):
+        """Flag tables whose cached dashboard figures are stale"""
+        for table in tables:
+            self._cache_dirty[table] = True
+        if "clients" in tables:
+            self._clients_cache = None
+        if "rates" in tables:
+            self._latest_rates = None
+    
+    def _get_latest_rates(self):
+        """Return the cached (gold_rate, silver_rate) of the newest rates row, or None"""
+        if self._latest_rates is None:
+            c = self.conn.cursor()
+            c.execute("SELECT gold_rate, silver_rate FROM rates ORDER BY date DESC LIMIT 1")
+            # An empty tuple marks "no rates yet" so it is cached too
+            self._latest_rates = c.fetchone() or ()
+        return self._latest_rates or None
+    
+    def _get_clients(self):
+        """Return cached (id, name, label) tuples for the client pickers"""
+        if self._clients_cache is None:
+            c = self.conn.cursor()
+            c.execute("SELECT id, name FROM clients ORDER BY name")
+            self._clients_cache = [(id, name, f"{name} (ID:{id})") for id, name in c]
+        return self._clients_cache
+    
+    def _clients_labels(self):
+        """Return the combobox labels of all clients"""
+        return [label for _, _, label in self._get_clients()]
+    
+    def _connect(self, **kwargs):
+        """Open a database connection with the app's PRAGMAs applied"""
+        # Room for every distinct statement the app issues, so repeated
+        # queries reuse their prepared statement instead of recompiling
+        conn = sqlite3.connect(self.db_path, cached_statements=256, **kwargs)
+        # WAL journal with relaxed syncing: readers don't block writers and
+        # commits no longer fsync the main database file every time
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+    
+    def _chunked_insert(self, c, table, columns, rows, chunk=100):
+        """Insert rows using multi-row VALUES statements of chunk rows each"""
+        row_params = "(" + ", ".join("?" * len(columns)) + ")"
+        insert = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        full = len(rows) - len(rows) % chunk
+        if full:
+            # Every full chunk shares one statement, so SQLite compiles it once
+            c.executemany(insert + ", ".join([row_params] * chunk),
+                          [[value for row in rows[i:i + chunk] for value in row]
+                           for i in range(0, full, chunk)])
+        if full < len(rows):
+            c.executemany(insert + row_params, rows[full:])
+    
+    def _submit_once(self, button, action):
+        """Run a dialog's save action with its button disabled
+        
+        Clicks queued while the action runs (including during its message
+        boxes) then can't save the same record twice.
+        """
+        button.state(['disabled'])
+        try:
+            action()
+        finally:
+            # The action destroys the dialog on success
+            if button.winfo_exists():
+                button.state(['!disabled'])
+    
+    def _optional_float(self, value):
+        """Parse an optional numeric entry, treating an empty field as NULL"""
+        return float(value) if value else None
+    
+    def _today(self):
+        """Return today's date as stored in the database"""
+        return datetime.now().strftime("%Y-%m-%d")
+    
+    def _fill_tree(self, tree, rows):
+        """Replace all rows of a treeview in one pass"""
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        # Call the Tcl insert command directly, skipping Treeview.insert's
+        # option formatting for every row
+        call, path = tree.tk.call, tree._w
+        for row in rows:
+            call(path, "insert", "", "end", "-values", tuple(map(str, row)))
+    
+    def _load_paged_tree(self, tree, query, params=(), search_columns=None):
+        """Reset a treeview to show the first page of a query
+        
+        When search_columns is given, the lowercased text of those columns is
+        kept per item so the loaded rows can be filtered without re-querying.
+        """
+        old_page = self._tree_pages.get(tree)
+        if old_page and old_page["texts"]:
+            # Rows hidden by a filter are detached, so delete them explicitly
+            tree.delete(*old_page["texts"])
+        self._tree_pages[tree] = {"query": query + " LIMIT ? OFFSET ?", "params": params,
+                                  "offset": 0, "done": False, "pending": False,
+                                  "search_columns": search_columns,
+                                  "texts": {} if search_columns else None}
+        self._fill_tree(tree, ())
+        self._load_next_page(tree)
+    
+    def _load_next_page(self, tree):
+        """Append the next page of rows to a paged treeview"""
+        page = self._tree_pages[tree]
+        page["pending"] = False
+        if page["done"]:
+            return
+        c = self.conn.cursor()
+        c.execute(page["query"], page["params"] + (self._page_size, page["offset"]))
+        search_columns = page["search_columns"]
+        texts = page["texts"]
+        count = 0
+        for row in c:
+            iid = tree.insert("", tk.END, values=tuple(map(str, row)))
+            if search_columns:
+                texts[iid] = self._search_text(row, search_columns)
+            count += 1
+        page["offset"] += count
+        page["done"] = count < self._page_size
+    
+    def _search_text(self, row, columns):
+        """Return the lowercased text of a row's searchable columns"""
+        return "\n".join(str(row[i]) for i in columns if row[i] is not None).lower()
+    
+    def _prepend_tree_row(self, tree, row):
+        """Show a newly saved row at the top of a treeview without reloading it"""
+        iid = tree.insert("", 0, values=tuple(map(str, row)))
+        page = self._tree_pages.get(tree)
+        if page:
+            # Rows already loaded shift down, so the next page starts one later
+            page["offset"] += 1
+            if page["texts"] is not None:
+                # The in-place filter re-attaches rows in this dict's order,
+                # so the new row has to come first here as well
+                page["texts"] = {iid: self._search_text(row, page["search_columns"]), **page["texts"]}
+    
+    def _remove_tree_row(self, tree, iid):
+        """Drop a deleted row from a treeview without reloading it"""
+        tree.delete(iid)
+        page = self._tree_pages.get(tree)
+        if page:
+            page["offset"] -= 1
+            if page["texts"] is not None:
+                page["texts"].pop(iid, None)
+    
+    def _on_paged_tree_scroll(self, tree, scrollbar, first, last):
+        """Update the scrollbar and fetch more rows near the end of the list"""
+        scrollbar.set(first, last)
+        page = self._tree_pages.get(tree)
+        if page and not page["done"] and not page["pending"] and float(last) > 0.9:
+            page["pending"] = True
+            self.root.after_idle(self._load_next_page, tree)
+    
     def setup_styles(self):
         """Configure ttk styles"""
         style = ttk.Style()
@@ -53,8 +315,7 @@ class GoldShopApp:
     
     def setup_database(self):
         """Initialize database and create tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self.conn.cursor()
         
         # Orders table
         c.execute('''CREATE TABLE IF NOT EXISTS orders
@@ -108,14 +369,112 @@ class GoldShopApp:
             FOREIGN KEY(order_id) REFERENCES orders(id)
         )''')
         
+        # Indexes for the columns the listings and reports filter/sort on
+        c.execute("CREATE INDEX IF NOT EXISTS idx_clients_name ON clients(name)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_clients_name_nocase ON clients(name COLLATE NOCASE)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_orders_date ON orders(order_date DESC)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_orders_client ON orders(client_id)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_inv_date ON inventory(date)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_inv_type_date ON inventory(transaction_type, date)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_inv_client ON inventory(client_id)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_order_items_order ON order_items(order_id)")
+        
+        # Partial covering indexes so stock totals are index-only scans
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_inv_received ON inventory(transaction_type, weight)
+                     WHERE transaction_type = 'received' ''')
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_inv_issued ON inventory(transaction_type, weight)
+                     WHERE transaction_type = 'issued' ''')
+        
+        # Full-text index over order descriptions, client names and statuses
+        self.setup_orders_fts(c)
+        
+        # Trigram index for substring search over client details
+        self.setup_clients_fts(c)
+        
+        # Gather planner statistics the first time the indexes exist
+        c.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if not c.fetchone():
+            c.execute("ANALYZE")
+        
         # Insert default rates if none exist
-        c.execute("SELECT COUNT(*) FROM rates")
-        if c.fetchone()[0] == 0:
-            c.execute("INSERT INTO rates (date, gold_rate, silver_rate) VALUES (?, ?, ?)",
-                     (datetime.now().strftime("%Y-%m-%d"), 5000, 60))
+        c.execute('''INSERT INTO rates (date, gold_rate, silver_rate)
+                     SELECT ?, ?, ? WHERE NOT EXISTS (SELECT 1 FROM rates)''',
+                  (self._today(), 5000, 60))
         
-        conn.commit()
-        conn.close()
+        self.conn.commit()
+    
+    def setup_orders_fts(self, c):
+        """Create the FTS5 order search index and the triggers that maintain it"""
+        c.execute("SELECT 1 FROM sqlite_master WHERE name = 'orders_fts'")
+        exists = c.fetchone()
+        try:
+            c.execute("CREATE VIRTUAL TABLE IF NOT EXISTS orders_fts USING fts5(description, client_name, status)")
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5, search falls back to LIKE
+            self.has_orders_fts = False
+            return
+        self.has_orders_fts = True
+        
+        c.execute('''CREATE TRIGGER IF NOT EXISTS orders_fts_insert AFTER INSERT ON orders BEGIN
+                         INSERT INTO orders_fts (rowid, description, client_name, status)
+                         VALUES (new.id, new.description,
+                                 (SELECT name FROM clients WHERE id = new.client_id), new.status);
+                     END''')
+        c.execute('''CREATE TRIGGER IF NOT EXISTS orders_fts_update AFTER UPDATE ON orders BEGIN
+                         UPDATE orders_fts SET description = new.description,
+                                client_name = (SELECT name FROM clients WHERE id = new.client_id),
+                                status = new.status
+                         WHERE rowid = new.id;
+                     END''')
+        c.execute('''CREATE TRIGGER IF NOT EXISTS orders_fts_delete AFTER DELETE ON orders BEGIN
+                         DELETE FROM orders_fts WHERE rowid = old.id;
+                     END''')
+        c.execute('''CREATE TRIGGER IF NOT EXISTS orders_fts_client_name AFTER UPDATE OF name ON clients BEGIN
+                         UPDATE orders_fts SET client_name = new.name
+                         WHERE rowid IN (SELECT id FROM orders WHERE client_id = new.id);
+                     END''')
+        
+        if not exists:
+            # Index the orders that were there before the search index
+            c.execute('''INSERT INTO orders_fts (rowid, description, client_name, status)
+                         SELECT orders.id, orders.description, clients.name, orders.status
+                         FROM orders LEFT JOIN clients ON orders.client_id = clients.id''')
+    
+    def setup_clients_fts(self, c):
+        """Create the trigram client search index and the triggers that maintain it"""
+        c.execute("SELECT 1 FROM sqlite_master WHERE name = 'clients_fts'")
+        exists = c.fetchone()
+        try:
+            c.execute('''CREATE VIRTUAL TABLE IF NOT EXISTS clients_fts
+                         USING fts5(name, phone, address, content='clients', content_rowid='id',
+                                    tokenize='trigram')''')
+        except sqlite3.OperationalError:
+            # SQLite without FTS5 or the trigram tokenizer (3.34+), search falls back to LIKE
+            self.has_clients_fts = False
+            return
+        self.has_clients_fts = True
+        
+        # External content table: the index reads the rows from clients and
+        # is told about old values explicitly when they change
+        c.execute('''CREATE TRIGGER IF NOT EXISTS clients_fts_insert AFTER INSERT ON clients BEGIN
+                         INSERT INTO clients_fts (rowid, name, phone, address)
+                         VALUES (new.id, new.name, new.phone, new.address);
+                     END''')
+        c.execute('''CREATE TRIGGER IF NOT EXISTS clients_fts_update AFTER UPDATE ON clients BEGIN
+                         INSERT INTO clients_fts (clients_fts, rowid, name, phone, address)
+                         VALUES ('delete', old.id, old.name, old.phone, old.address);
+                         INSERT INTO clients_fts (rowid, name, phone, address)
+                         VALUES (new.id, new.name, new.phone, new.address);
+                     END''')
+        c.execute('''CREATE TRIGGER IF NOT EXISTS clients_fts_delete AFTER DELETE ON clients BEGIN
+                         INSERT INTO clients_fts (clients_fts, rowid, name, phone, address)
+                         VALUES ('delete', old.id, old.name, old.phone, old.address);
+                     END''')
+        
+        if not exists:
+            # Index the clients that were there before the search index
+            c.execute("INSERT INTO clients_fts (clients_fts) VALUES ('rebuild')")
     
     def create_main_frame(self):
         """Create the main container frame"""
@@ -131,7 +490,7 @@ class GoldShopApp:
         file_menu.add_command(label="Backup Database", command=self.backup_database)
         file_menu.add_command(label="Restore Database", command=self.restore_database)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.on_close)
         menubar.add_cascade(label="File", menu=file_menu)
         
         # Tools menu
@@ -163,6 +522,8 @@ class GoldShopApp:
         )
         if backup_path:
             try:
+                # Fold the WAL into the main file so the copy is complete
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
                 shutil.copy2(self.db_path, backup_path)
                 messagebox.showinfo("Success", f"Database backed up to:\n{backup_path}")
             except Exception as e:
@@ -175,13 +536,21 @@ class GoldShopApp:
         )
         if backup_path:
             try:
-                # Close any existing connections
-                if hasattr(self, 'conn'):
-                    self.conn.close()
-                
-                shutil.copy2(backup_path, self.db_path)
+                # Close every connection so SQLite checkpoints and lets go
+                # of the WAL; the worker's reader is closed on its own thread
+                self._db_pool.submit(self._close_db_reader).result()
+                self._db_reader = None
+                self.conn.close()
+                try:
+                    shutil.copy2(backup_path, self.db_path)
+                    # A WAL left beside the copied file would be replayed over it
+                    for suffix in ("-wal", "-shm"):
+                        if os.path.exists(self.db_path + suffix):
+                            os.remove(self.db_path + suffix)
+                finally:
+                    self.conn = self._connect(check_same_thread=False)
                 messagebox.showinfo("Success", "Database restored successfully!\nPlease restart the application.")
-                self.root.quit()
+                self.on_close()
             except Exception as e:
                 messagebox.showerror("Error", f"Restore failed:\n{str(e)}")
     
@@ -192,11 +561,7 @@ class GoldShopApp:
         dialog.grab_set()
         
         # Get current rates
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT gold_rate, silver_rate FROM rates ORDER BY date DESC LIMIT 1")
-        current_rates = c.fetchone() or (5000, 60)
-        conn.close()
+        current_rates = self._get_latest_rates() or (5000, 60)
         
         ttk.Label(dialog, text="Gold Rate (per gram):").grid(row=0, column=0, padx=5, pady=5, sticky=tk.E)
         gold_rate_entry = ttk.Entry(dialog)
@@ -212,17 +577,15 @@ class GoldShopApp:
             try:
                 gold_rate = float(gold_rate_entry.get())
                 silver_rate = float(silver_rate_entry.get())
-                today = datetime.now().strftime("%Y-%m-%d")  # <-- Add this line
+                today = self._today()
 
-                conn = sqlite3.connect(self.db_path)
-                c = conn.cursor()
-                c.execute("SELECT 1 FROM rates WHERE date = ?", (today,))
-                if c.fetchone():
-                    c.execute("UPDATE rates SET gold_rate = ?, silver_rate = ? WHERE date = ?", (gold_rate, silver_rate, today))
-                else:
-                    c.execute("INSERT INTO rates (date, gold_rate, silver_rate) VALUES (?, ?, ?)", (today, gold_rate, silver_rate))
-                conn.commit()
-                conn.close()
+                with self.conn:
+                    self.conn.execute('''INSERT INTO rates (date, gold_rate, silver_rate) VALUES (?, ?, ?)
+                                         ON CONFLICT(date) DO UPDATE SET
+                                         gold_rate = excluded.gold_rate,
+                                         silver_rate = excluded.silver_rate''',
+                                      (today, gold_rate, silver_rate))
+                self._mark_dirty("rates")
 
                 messagebox.showinfo("Success", "Rates updated successfully!")
                 dialog.destroy()
@@ -239,12 +602,8 @@ class GoldShopApp:
         dialog.grab_set()
         
         # Get current gold rate
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT gold_rate FROM rates ORDER BY date DESC LIMIT 1")
-        row = c.fetchone()
-        current_rate = row[0] if row else 5000
-        conn.close()
+        rates = self._get_latest_rates()
+        current_rate = rates[0] if rates else 5000
         
         ttk.Label(dialog, text="Weight (grams):").grid(row=0, column=0, padx=5, pady=5, sticky=tk.E)
         weight_entry = ttk.Entry(dialog)
@@ -271,176 +630,207 @@ class GoldShopApp:
         
         ttk.Button(dialog, text="Calculate", command=calculate).grid(row=3, column=0, columnspan=2, pady=10)
     
+    def _run_report(self, build, message):
+        """Build a report from its own connection on the PDF worker pool"""
+        self._render_in_background(self._build_with_connection, message, "report", build)
+    
+    def _build_with_connection(self, build):
+        """Run a report builder on a connection private to the worker thread"""
+        conn = self._connect()
+        try:
+            return build(conn)
+        finally:
+            conn.close()
+    
+    def _query_in_background(self, sql, params, callback):
+        """Run a read query on the database worker and pass its rows to callback"""
+        self._db_pool.submit(self._query_worker, sql, params, callback)
+    
+    def _query_worker(self, sql, params, callback):
+        """Worker task that queries through a connection owned by the worker thread"""
+        try:
+            if self._db_reader is None:
+                self._db_reader = self._connect()
+            rows = self._db_reader.execute(sql, params).fetchall()
+        except Exception as e:
+            self._ui_queue.put((messagebox.showerror, ("Error", f"Failed to load data:\n{str(e)}")))
+        else:
+            self._ui_queue.put((callback, (rows,)))
+    
+    def _close_db_reader(self):
+        """Close the database worker's connection from its own thread"""
+        if self._db_reader is not None:
+            self._db_reader.close()
+    
+    def _render_in_background(self, render, message, kind, *args):
+        """Render a PDF on the worker pool so the UI stays responsive"""
+        self._pdf_pool.submit(self._render_worker, render, message, kind, args)
+    
+    def _render_worker(self, render, message, kind, args):
+        """Pool task that renders a PDF and queues the outcome for the Tk thread"""
+        try:
+            report_path = render(*args)
+        except Exception as e:
+            self._ui_queue.put((messagebox.showerror, ("Error", f"Failed to generate {kind}:\n{str(e)}")))
+        else:
+            self._ui_queue.put((self._show_report, (message, report_path)))
+    
+    def _show_report(self, message, report_path):
+        """Show where a generated PDF was saved and open it"""
+        messagebox.showinfo("Success", f"{message}:\n{os.path.abspath(report_path)}")
+        webbrowser.open(report_path)
+    
+    def _write_pdf(self, pdf, path):
+        """Render a PDF in memory and save it with a single write"""
+        # fpdf2 renders to a bytearray when no file name is given
+        data = pdf.output()
+        with open(path, 'wb') as f:
+            f.write(data)
+    
+    def _pdf_table(self, pdf, widths, headers, rows, font_size=8, header_align='L', aligns=None):
+        """Draw a bordered table of pre-formatted string rows"""
+        height = 10
+        columns = tuple(zip(widths, aligns or ('L',) * len(widths)))
+        cell = pdf.cell
+        
+        pdf.set_font("Helvetica", 'B', 10)
+        for width, header in zip(widths, headers):
+            cell(width, height, header, 1, align=header_align)
+        pdf.ln(height)
+        
+        pdf.set_font("Helvetica", size=font_size)
+        for row in rows:
+            for (width, align), value in zip(columns, row):
+                cell(width, height, value, 1, align=align)
+            pdf.ln(height)
+    
     def generate_daily_summary(self):
         """Generate daily summary report"""
-        conn = sqlite3.connect(self.db_path)
+        self._run_report(self._build_daily_summary, "Daily summary report generated")
+    
+    def _build_daily_summary(self, conn):
+        """Write the daily summary PDF and return its path"""
         c = conn.cursor()
         
         # Get today's date
-        today = datetime.now().strftime("%Y-%m-%d")
-        
-        # Get today's orders
-        c.execute('''SELECT COUNT(*), SUM(actual_weight) 
-                     FROM orders 
-                     WHERE order_date = ? AND status != 'Cancelled' ''', (today,))
-        order_count, total_weight = c.fetchone()
-        order_count = order_count or 0
-        total_weight = total_weight or 0
-        
-        # Get today's transactions
-        c.execute('''SELECT 
-                     SUM(CASE WHEN transaction_type = 'received' THEN weight ELSE 0 END),
-                     SUM(CASE WHEN transaction_type = 'issued' THEN weight ELSE 0 END)
-                     FROM inventory WHERE date = ?''', (today,))
-        received, issued = c.fetchone()
-        received = received or 0
-        issued = issued or 0
-        
-        # Get current rates
-        c.execute("SELECT gold_rate FROM rates ORDER BY date DESC LIMIT 1")
-        gold_rate = c.fetchone()[0] if c.fetchone() else 0
-        
-        conn.close()
+        today = self._today()
+        
+        # Get today's orders, transactions and the current gold rate
+        c.execute('''SELECT o.order_count, o.total_weight, i.received, i.issued,
+                     COALESCE((SELECT gold_rate FROM rates ORDER BY date DESC LIMIT 1), 0)
+                     FROM (SELECT COUNT(*) AS order_count,
+                                  COALESCE(SUM(actual_weight), 0) AS total_weight
+                           FROM orders
+                           WHERE order_date = ?1 AND status != 'Cancelled') AS o,
+                          (SELECT COALESCE(SUM(CASE WHEN transaction_type = 'received' THEN weight END), 0) AS received,
+                                  COALESCE(SUM(CASE WHEN transaction_type = 'issued' THEN weight END), 0) AS issued
+                           FROM inventory WHERE date = ?1) AS i''', (today,))
+        order_count, total_weight, received, issued, gold_rate = c.fetchone()
         
         # Create PDF report
         pdf = FPDF()
         pdf.add_page()
-        pdf.set_font("Arial", size=12)
+        pdf.set_font("Helvetica", size=12)
         
         # Title
-        pdf.cell(200, 10, txt=f"Daily Summary Report - {today}", ln=1, align='C')
+        pdf.cell(200, 10, text=f"Daily Summary Report - {today}", align='C', new_x="LMARGIN", new_y="NEXT")
         pdf.ln(10)
         
         # Orders summary
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(200, 10, txt="Orders Summary", ln=1)
-        pdf.set_font("Arial", size=10)
-        pdf.cell(200, 10, txt=f"Total Orders: {order_count}", ln=1)
-        pdf.cell(200, 10, txt=f"Total Gold Weight: {total_weight:.2f}g", ln=1)
-        pdf.cell(200, 10, txt=f"Estimated Value: KWD{total_weight * gold_rate:,.2f}", ln=1)
+        pdf.set_font("Helvetica", 'B', 12)
+        pdf.cell(200, 10, text="Orders Summary", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("Helvetica", size=10)
+        pdf.cell(200, 10, text=f"Total Orders: {order_count}", new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(200, 10, text=f"Total Gold Weight: {total_weight:.2f}g", new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(200, 10, text=f"Estimated Value: KWD{total_weight * gold_rate:,.2f}", new_x="LMARGIN", new_y="NEXT")
         pdf.ln(5)
         
         # Inventory summary
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(200, 10, txt="Inventory Summary", ln=1)
-        pdf.set_font("Arial", size=10)
-        pdf.cell(200, 10, txt=f"Gold Received: {received:.2f}g", ln=1)
-        pdf.cell(200, 10, txt=f"Gold Issued: {issued:.2f}g", ln=1)
-        pdf.cell(200, 10, txt=f"Net Change: {received - issued:.2f}g", ln=1)
+        pdf.set_font("Helvetica", 'B', 12)
+        pdf.cell(200, 10, text="Inventory Summary", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("Helvetica", size=10)
+        pdf.cell(200, 10, text=f"Gold Received: {received:.2f}g", new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(200, 10, text=f"Gold Issued: {issued:.2f}g", new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(200, 10, text=f"Net Change: {received - issued:.2f}g", new_x="LMARGIN", new_y="NEXT")
         pdf.ln(10)
         
         # Save the PDF
         report_path = f"daily_summary_{today}.pdf"
-        pdf.output(report_path)
-        
-        # Show success message
-        messagebox.showinfo("Success", f"Daily summary report generated:\n{os.path.abspath(report_path)}")
-        webbrowser.open(report_path)
+        self._write_pdf(pdf, report_path)
+        return report_path
     
     def generate_inventory_report(self):
         """Generate inventory report"""
-        conn = sqlite3.connect(self.db_path)
+        self._run_report(self._build_inventory_report, "Inventory report generated")
+    
+    def _build_inventory_report(self, conn):
+        """Write the inventory report PDF and return its path"""
         c = conn.cursor()
         
-        # Get inventory data
-        c.execute('''SELECT date, transaction_type, weight, purity, price_per_gm, notes 
-                     FROM inventory ORDER BY date DESC''')
-        inventory_data = c.fetchall()
-        
         # Get current stock
-        c.execute('''SELECT 
-                     SUM(CASE WHEN transaction_type = 'received' THEN weight ELSE 0 END),
-                     SUM(CASE WHEN transaction_type = 'issued' THEN weight ELSE 0 END)
-                     FROM inventory''')
-        received, issued = c.fetchone()
-        current_stock = (received or 0) - (issued or 0)
-        
-        conn.close()
+        c.execute('''SELECT
+                     COALESCE((SELECT SUM(weight) FROM inventory WHERE transaction_type = 'received'), 0)
+                     - COALESCE((SELECT SUM(weight) FROM inventory WHERE transaction_type = 'issued'), 0)''')
+        current_stock = c.fetchone()[0]
         
         # Create PDF report
         pdf = FPDF()
         pdf.add_page()
-        pdf.set_font("Arial", size=12)
+        pdf.set_font("Helvetica", size=12)
         
         # Title
-        pdf.cell(200, 10, txt="Gold Inventory Report", ln=1, align='C')
+        pdf.cell(200, 10, text="Gold Inventory Report", align='C', new_x="LMARGIN", new_y="NEXT")
         pdf.ln(10)
         
         # Current stock
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(200, 10, txt=f"Current Gold Stock: {current_stock:.2f}g", ln=1)
+        pdf.set_font("Helvetica", 'B', 12)
+        pdf.cell(200, 10, text=f"Current Gold Stock: {current_stock:.2f}g", new_x="LMARGIN", new_y="NEXT")
         pdf.ln(10)
         
-        # Transactions table
-        pdf.set_font("Arial", 'B', 10)
-        pdf.cell(30, 10, "Date", 1)
-        pdf.cell(25, 10, "Type", 1)
-        pdf.cell(25, 10, "Weight (g)", 1)
-        pdf.cell(25, 10, "Purity", 1)
-        pdf.cell(30, 10, "Rate (KWD/g)", 1)
-        pdf.cell(60, 10, "Notes", 1, ln=1)
-        
-        pdf.set_font("Arial", size=8)
-        for row in inventory_data:
-            pdf.cell(30, 10, row[0], 1)
-            pdf.cell(25, 10, row[1].capitalize(), 1)
-            pdf.cell(25, 10, f"{row[2]:.2f}", 1)
-            pdf.cell(25, 10, f"{row[3]:.3f}", 1)
-            pdf.cell(30, 10, f"{row[4]:.2f}" if row[4] else "N/A", 1)
-            pdf.cell(60, 10, row[5] or "", 1, ln=1)
+        # Transactions table, streamed straight from the cursor
+        c.execute('''SELECT date, transaction_type, weight, purity, price_per_gm, notes 
+                     FROM inventory ORDER BY date DESC''')
+        rows = ((date, trans_type.capitalize(), f"{weight:.2f}", f"{purity:.3f}",
+                 f"{price:.2f}" if price else "N/A", notes or "")
+                for date, trans_type, weight, purity, price, notes in c)
+        self._pdf_table(pdf, (30, 25, 25, 25, 30, 60),
+                        ("Date", "Type", "Weight (g)", "Purity", "Rate (KWD/g)", "Notes"), rows)
         
         # Save the PDF
         report_path = "inventory_report.pdf"
-        pdf.output(report_path)
-        
-        # Show success message
-        messagebox.showinfo("Success", f"Inventory report generated:\n{os.path.abspath(report_path)}")
-        webbrowser.open(report_path)
+        self._write_pdf(pdf, report_path)
+        return report_path
     
     def generate_client_orders_report(self):
         """Generate client orders report"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        # Get client orders data
-        c.execute('''SELECT clients.name, clients.phone, 
-                     COUNT(orders.id), SUM(orders.actual_weight)
-                     FROM clients LEFT JOIN orders ON clients.id = orders.client_id
-                     GROUP BY clients.id ORDER BY clients.name''')
-        client_data = c.fetchall()
-        
-        conn.close()
-        
+        self._run_report(self._build_client_orders_report, "Client orders report generated")
+    
+    def _build_client_orders_report(self, conn):
+        """Write the client orders report PDF and return its path"""
         # Create PDF report
         pdf = FPDF()
         pdf.add_page()
-        pdf.set_font("Arial", size=12)
+        pdf.set_font("Helvetica", size=12)
         
         # Title
-        pdf.cell(200, 10, txt="Client Orders Report", ln=1, align='C')
+        pdf.cell(200, 10, text="Client Orders Report", align='C', new_x="LMARGIN", new_y="NEXT")
         pdf.ln(10)
         
-        # Clients table
-        pdf.set_font("Arial", 'B', 10)
-        pdf.cell(80, 10, "Client Name", 1)
-        pdf.cell(40, 10, "Phone", 1)
-        pdf.cell(30, 10, "Total Orders", 1)
-        pdf.cell(40, 10, "Total Gold (g)", 1, ln=1)
-        
-        pdf.set_font("Arial", size=8)
-        for row in client_data:
-            pdf.cell(80, 10, row[0], 1)
-            pdf.cell(40, 10, row[1] or "", 1)
-            pdf.cell(30, 10, str(row[2]), 1)
-            pdf.cell(40, 10, f"{row[3]:.2f}" if row[3] else "0.00", 1, ln=1)
+        # Clients table, streamed straight from the cursor
+        c = conn.cursor()
+        c.execute('''SELECT clients.name, clients.phone, 
+                     COUNT(orders.id), SUM(orders.actual_weight)
+                     FROM clients LEFT JOIN orders ON clients.id = orders.client_id
+                     GROUP BY clients.id ORDER BY clients.name''')
+        rows = ((name, phone or "", str(order_count), f"{total_gold:.2f}" if total_gold else "0.00")
+                for name, phone, order_count, total_gold in c)
+        self._pdf_table(pdf, (80, 40, 30, 40),
+                        ("Client Name", "Phone", "Total Orders", "Total Gold (g)"), rows)
         
         # Save the PDF
         report_path = "client_orders_report.pdf"
-        pdf.output(report_path)
-        
-        # Show success message
-        messagebox.showinfo("Success", f"Client orders report generated:\n{os.path.abspath(report_path)}")
-        webbrowser.open(report_path)
+        self._write_pdf(pdf, report_path)
+        return report_path
     
     def show_about(self):
         """Show about dialog"""
@@ -469,6 +859,7 @@ class GoldShopApp:
         self.notebook.add(self.invoices_tab, text="Invoices")
         
         self.notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
         # Build each tab
         self.build_dashboard_tab()
@@ -477,6 +868,11 @@ class GoldShopApp:
         self.build_clients_tab()
         self.build_invoices_tab()
     
+    def on_tab_changed(self, event):
+        """Refresh the dashboard whenever it is brought to the front"""
+        if str(self.notebook.select()) == str(self.dashboard_tab):
+            self.load_dashboard_data()
+    
     def build_dashboard_tab(self):
         """Build the dashboard tab"""
         # Current rates frame
@@ -532,41 +928,42 @@ class GoldShopApp:
     
     def load_dashboard_data(self):
         """Load data for dashboard"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        # Load current rates
-        c.execute("SELECT gold_rate, silver_rate FROM rates ORDER BY date DESC LIMIT 1")
-        rates = c.fetchone()
-        if rates:
-            self.gold_rate_label.config(text=f"KWD{rates[0]:.2f}")
-            self.silver_rate_label.config(text=f"KWD{rates[1]:.2f}")
-        
-        # Load stats
-        c.execute("SELECT COUNT(*) FROM orders")
-        self.dashboard_orders_count_label.config(text=c.fetchone()[0])
-        
-        c.execute("SELECT COUNT(*) FROM orders WHERE status='Pending'")
-        self.dashboard_pending_orders_label.config(text=c.fetchone()[0])
-        
-        c.execute("SELECT SUM(weight) FROM inventory WHERE transaction_type='received'")
-        received = c.fetchone()[0] or 0
-        c.execute("SELECT SUM(weight) FROM inventory WHERE transaction_type='issued'")
-        issued = c.fetchone()[0] or 0
-        self.dashboard_gold_stock_label.config(text=f"{received - issued:.2f}")
-        
-        c.execute("SELECT COUNT(*) FROM clients")
-        self.dashboard_clients_count_label.config(text=c.fetchone()[0])
-        
-        # Load recent orders
-        self.recent_orders_tree.delete(*self.recent_orders_tree.get_children())
-        c.execute('''SELECT orders.id, clients.name, orders.description, orders.status, orders.order_date
-                     FROM orders LEFT JOIN clients ON orders.client_id = clients.id
-                     ORDER BY orders.order_date DESC LIMIT 10''')
-        for row in c.fetchall():
-            self.recent_orders_tree.insert("", tk.END, values=row)
+        dirty = self._cache_dirty
+        if self._dashboard_cache is not None and not any(dirty.values()):
+            return
         
-        conn.close()
+        c = self.conn.cursor()
+        
+        # Load current rates and stats in one round-trip
+        c.execute('''SELECT
+                     (SELECT COUNT(*) FROM orders),
+                     (SELECT COUNT(*) FROM orders WHERE status='Pending'),
+                     COALESCE((SELECT SUM(weight) FROM inventory WHERE transaction_type='received'), 0)
+                         - COALESCE((SELECT SUM(weight) FROM inventory WHERE transaction_type='issued'), 0),
+                     (SELECT COUNT(*) FROM clients),
+                     (SELECT gold_rate FROM rates ORDER BY date DESC LIMIT 1),
+                     (SELECT silver_rate FROM rates ORDER BY date DESC LIMIT 1)''')
+        self._dashboard_cache = c.fetchone()
+        orders_count, pending_count, gold_stock, clients_count, gold_rate, silver_rate = self._dashboard_cache
+        
+        if gold_rate is not None:
+            self.gold_rate_label.config(text=f"KWD{gold_rate:.2f}")
+            self.silver_rate_label.config(text=f"KWD{silver_rate:.2f}")
+        
+        self.dashboard_orders_count_label.config(text=orders_count)
+        self.dashboard_pending_orders_label.config(text=pending_count)
+        self.dashboard_gold_stock_label.config(text=f"{gold_stock:.2f}")
+        self.dashboard_clients_count_label.config(text=clients_count)
+        
+        # Load recent orders (they show client names, so clients count too)
+        if dirty["orders"] or dirty["clients"]:
+            c.execute('''SELECT orders.id, clients.name, orders.description, orders.status, orders.order_date
+                         FROM orders LEFT JOIN clients ON orders.client_id = clients.id
+                         ORDER BY orders.order_date DESC LIMIT 10''')
+            self._fill_tree(self.recent_orders_tree, c.fetchall())
+        
+        for table in dirty:
+            dirty[table] = False
     
     def build_orders_tab(self):
         """Build the orders management tab"""
@@ -589,7 +986,7 @@ class GoldShopApp:
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=5)
         self.order_search_entry = ttk.Entry(search_frame, width=30)
         self.order_search_entry.pack(side=tk.LEFT, padx=5)
-        self.order_search_entry.bind("<KeyRelease>", lambda e: self.search_orders())
+        self.order_search_entry.bind("<KeyRelease>", self.on_order_search_key)
         
         ttk.Button(search_frame, text="Clear", command=self.clear_order_search).pack(side=tk.LEFT, padx=5)
         
@@ -620,59 +1017,65 @@ class GoldShopApp:
         
         # Add scrollbar
         scrollbar = ttk.Scrollbar(self.orders_tab, orient=tk.VERTICAL, command=self.orders_tree.yview)
-        self.orders_tree.configure(yscrollcommand=scrollbar.set)
+        self.orders_tree.configure(yscrollcommand=lambda first, last: self._on_paged_tree_scroll(
+            self.orders_tree, scrollbar, first, last))
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.orders_tree.pack(fill=tk.BOTH, expand=True)
     
+    def on_order_search_key(self, event):
+        """Run the order search 150 ms after the last keystroke"""
+        if self._order_search_after:
+            self.root.after_cancel(self._order_search_after)
+        self._order_search_after = self.root.after(150, self.search_orders)
+    
     def search_orders(self):
         """Search orders based on search term"""
+        # Called directly (e.g. by Clear), a keystroke's search may still be pending
+        if self._order_search_after:
+            self.root.after_cancel(self._order_search_after)
+            self._order_search_after = None
         search_term = self.order_search_entry.get().strip()
-        if not search_term:
-            self.load_orders()
-            return
-        
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
         
-        query = '''SELECT orders.id, clients.name, orders.description, 
-                  orders.estimated_weight, orders.actual_weight, orders.purity,
-                  orders.order_date, orders.delivery_date, orders.status
-                  FROM orders
-                  LEFT JOIN clients ON orders.client_id = clients.id
-                  WHERE clients.name LIKE ? OR orders.description LIKE ? OR orders.status LIKE ?
-                  ORDER BY orders.order_date DESC'''
+        if self.has_orders_fts:
+            # Every word typed must start a word in the client, description or status
+            words = re.findall(r"\w+", search_term.lower())
+        
+        # With every order already loaded, filter the existing rows in place
+        page = self._tree_pages.get(self.orders_tree)
+        if page and page["done"] and page["texts"] is not None:
+            if self.has_orders_fts:
+                patterns = [re.compile(r"\b" + re.escape(word)) for word in words]
+                matches = [iid for iid, text in page["texts"].items()
+                           if all(pattern.search(text) for pattern in patterns)]
+            else:
+                term = search_term.lower()
+                matches = [iid for iid, text in page["texts"].items() if term in text]
+            self.orders_tree.set_children("", *matches)
+            return
         
-        search_param = f"%{search_term}%"
-        c.execute(query, (search_param, search_param, search_param))
+        if not search_term or (self.has_orders_fts and not words):
+            self.load_orders()
+            return
         
-        self.orders_tree.delete(*self.orders_tree.get_children())
-        for row in c.fetchall():
-            self.orders_tree.insert("", tk.END, values=row)
+        if self.has_orders_fts:
+            query = self._SQL_SEARCH_ORDERS_FTS
+            params = (" ".join(f'"{word}"*' for word in words),)
+        else:
+            query = self._SQL_SEARCH_ORDERS_LIKE
+            search_param = f"%{search_term}%"
+            params = (search_param, search_param, search_param)
         
-        conn.close()
+        self._load_paged_tree(self.orders_tree, query, params)
     
     def clear_order_search(self):
-        """Clear order search and reload all orders"""
+        """Clear order search and show all orders"""
         self.order_search_entry.delete(0, tk.END)
-        self.load_orders()
+        self.search_orders()
     
     def load_orders(self):
         """Load orders from database into the treeview"""
-        self.orders_tree.delete(*self.orders_tree.get_children())
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        c.execute('''SELECT orders.id, clients.name, orders.description, 
-                    orders.estimated_weight, orders.actual_weight, orders.purity,
-                    orders.order_date, orders.delivery_date, orders.status
-                    FROM orders
-                    LEFT JOIN clients ON orders.client_id = clients.id
-                    ORDER BY orders.order_date DESC''')
-        
-        for row in c.fetchall():
-            self.orders_tree.insert("", tk.END, values=row)
-        
-        conn.close()
+        # Client name, description and status are searchable in place
+        self._load_paged_tree(self.orders_tree, self._SQL_LOAD_ORDERS, search_columns=(1, 2, 8))
     
     def add_order(self):
         """Open dialog to add a new order"""
@@ -687,12 +1090,7 @@ class GoldShopApp:
         client_combobox.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W)
         
         # Get client names for combobox
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT id, name FROM clients ORDER BY name")
-        clients = c.fetchall()
-        client_combobox['values'] = [f"{name} (ID:{id})" for id, name in clients]
-        conn.close()
+        client_combobox['values'] = self._clients_labels()
         
         # Order details
         ttk.Label(dialog, text="Description:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.E)
@@ -711,7 +1109,7 @@ class GoldShopApp:
         ttk.Label(dialog, text="Delivery Date:").grid(row=4, column=0, padx=5, pady=5, sticky=tk.E)
         delivery_entry = ttk.Entry(dialog)
         delivery_entry.grid(row=4, column=1, padx=5, pady=5, sticky=tk.W)
-        delivery_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        delivery_entry.insert(0, self._today())
         
         ttk.Label(dialog, text="Status:").grid(row=5, column=0, padx=5, pady=5, sticky=tk.E)
         status_combobox = ttk.Combobox(dialog, values=["Pending", "In Progress", "Completed", "Delivered", "Cancelled"])
@@ -764,7 +1162,8 @@ class GoldShopApp:
         btn_frame = ttk.Frame(dialog)
         btn_frame.grid(row=8, column=0, columnspan=2, pady=10)
         
-        ttk.Button(btn_frame, text="Save", command=lambda: self.save_order(
+        save_btn = ttk.Button(btn_frame, text="Save")
+        save_btn.configure(command=lambda: self._submit_once(save_btn, lambda: self.save_order(
             client_var.get(),
             desc_entry.get(),
             est_weight_entry.get(),
@@ -775,20 +1174,14 @@ class GoldShopApp:
             making_charges_entry.get(),
             items,
             dialog
-        )).pack(side=tk.LEFT, padx=5)
+        )))
+        save_btn.pack(side=tk.LEFT, padx=5)
         
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
     
     def save_order(self, client, description, est_weight, purity, delivery_date, status, price_per_gm, making_charges, items, dialog):
         """Save new order to database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-
-            c.execute("SELECT gold_rate, silver_rate FROM rates ORDER BY date DESC LIMIT 1")
-            row = c.fetchone()
-            current_rates = row if row else (5000, 60)
-
             if "(ID:" not in client:
                 messagebox.showerror("Error", "Please select a client.")
                 return
@@ -796,32 +1189,47 @@ class GoldShopApp:
             # Extract client ID from combobox text
             client_id = int(client.split("(ID:")[1].rstrip(")"))
 
-            c.execute('''INSERT INTO orders 
-                        (client_id, description, estimated_weight, actual_weight, purity, order_date, delivery_date, status, price_per_gm, making_charges)
-                        VALUES (?, ?, ?, NULL, ?, ?, ?, ?, ?, ?)''',
-                    (client_id, description, float(est_weight), float(purity), 
-                     datetime.now().strftime("%Y-%m-%d"), delivery_date, status, 
-                     float(price_per_gm) if price_per_gm else None,
-                     float(making_charges) if making_charges else None))
+            # Parse every number before touching the database
+            est_weight = float(est_weight)
+            purity = float(purity)
+            price_per_gm = self._optional_float(price_per_gm)
+            making_charges = self._optional_float(making_charges)
+            item_rows = [(desc, float(weight), float(item_purity), float(rate), float(amount))
+                         for desc, weight, item_purity, rate, amount in items]
 
-            # Get the last inserted order ID
-            order_id = c.lastrowid
-            for desc, weight, purity, rate, amount in items:
-                c.execute('''INSERT INTO order_items (order_id, description, weight, purity, rate, amount)
-                 VALUES (?, ?, ?, ?, ?, ?)''',
-              (order_id, desc, weight, purity, rate, amount))
+            with self.conn:
+                c = self.conn.cursor()
+                c.execute('''INSERT INTO orders 
+                            (client_id, description, estimated_weight, actual_weight, purity, order_date, delivery_date, status, price_per_gm, making_charges)
+                            VALUES (?, ?, ?, NULL, ?, ?, ?, ?, ?, ?)''',
+                        (client_id, description, est_weight, purity, 
+                         self._today(), delivery_date, status, 
+                         price_per_gm, making_charges))
 
-            conn.commit()
-            conn.close()
+                # Get the last inserted order ID
+                order_id = c.lastrowid
+                self._chunked_insert(c, "order_items", self._ORDER_ITEM_COLUMNS,
+                                     [(order_id,) + row for row in item_rows])
+
+            self._mark_dirty("orders")
 
             messagebox.showinfo("Success", "Order added successfully!")
             dialog.destroy()
-            self.load_orders()
+            self._show_new_order(order_id)
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {str(e)}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save order: {str(e)}")
     
+    def _show_new_order(self, order_id):
+        """Add a just-saved order to the top of the orders list"""
+        c = self.conn.cursor()
+        c.execute(self._SQL_ORDER_ROW, (order_id,))
+        self._prepend_tree_row(self.orders_tree, c.fetchone())
+        if self.order_search_entry.get().strip():
+            # Re-apply the active search to the new row
+            self.search_orders()
+    
     def edit_order(self):
         """Edit selected order"""
         selected = self.orders_tree.selection()
@@ -831,15 +1239,14 @@ class GoldShopApp:
         
         order_id = self.orders_tree.item(selected[0], "values")[0]
         
-        # Fetch order details
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        # Fetch order details, read by column name
+        c = self.conn.cursor()
+        c.row_factory = sqlite3.Row
         c.execute('''SELECT orders.*, clients.name 
                      FROM orders 
                      LEFT JOIN clients ON orders.client_id = clients.id
                      WHERE orders.id = ?''', (order_id,))
         order = c.fetchone()
-        conn.close()
         
         if not order:
             messagebox.showerror("Error", "Order not found")
@@ -852,61 +1259,56 @@ class GoldShopApp:
         
         # Client selection
         ttk.Label(dialog, text="Client:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.E)
-        client_var = tk.StringVar(value=f"{order[11]} (ID:{order[1]})")
+        client_var = tk.StringVar(value=f"{order['name']} (ID:{order['client_id']})")
         client_combobox = ttk.Combobox(dialog, textvariable=client_var, state="readonly")
         client_combobox.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W)
         
         # Get client names for combobox
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT id, name FROM clients ORDER BY name")
-        clients = c.fetchall()
-        client_combobox['values'] = [f"{name} (ID:{id})" for id, name in clients]
-        conn.close()
+        client_combobox['values'] = self._clients_labels()
         
         # Order details
         ttk.Label(dialog, text="Description:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.E)
         desc_entry = ttk.Entry(dialog, width=40)
         desc_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
-        desc_entry.insert(0, order[2])
+        desc_entry.insert(0, order["description"])
         
         ttk.Label(dialog, text="Estimated Weight (g):").grid(row=2, column=0, padx=5, pady=5, sticky=tk.E)
         est_weight_entry = ttk.Entry(dialog)
         est_weight_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.W)
-        est_weight_entry.insert(0, order[3])
+        est_weight_entry.insert(0, order["estimated_weight"])
         
         ttk.Label(dialog, text="Actual Weight (g):").grid(row=3, column=0, padx=5, pady=5, sticky=tk.E)
         actual_weight_entry = ttk.Entry(dialog)
         actual_weight_entry.grid(row=3, column=1, padx=5, pady=5, sticky=tk.W)
-        if order[4]:  # If actual weight exists
-            actual_weight_entry.insert(0, order[4])
+        if order["actual_weight"]:  # If actual weight exists
+            actual_weight_entry.insert(0, order["actual_weight"])
         
         ttk.Label(dialog, text="Purity:").grid(row=4, column=0, padx=5, pady=5, sticky=tk.E)
         purity_entry = ttk.Entry(dialog)
         purity_entry.grid(row=4, column=1, padx=5, pady=5, sticky=tk.W)
-        purity_entry.insert(0, order[5])
+        purity_entry.insert(0, order["purity"])
         
         ttk.Label(dialog, text="Delivery Date:").grid(row=5, column=0, padx=5, pady=5, sticky=tk.E)
         delivery_entry = ttk.Entry(dialog)
         delivery_entry.grid(row=5, column=1, padx=5, pady=5, sticky=tk.W)
-        delivery_entry.insert(0, order[7])
+        delivery_entry.insert(0, order["delivery_date"])
         
         ttk.Label(dialog, text="Status:").grid(row=6, column=0, padx=5, pady=5, sticky=tk.E)
         status_combobox = ttk.Combobox(dialog, values=["Pending", "In Progress", "Completed", "Delivered", "Cancelled"])
         status_combobox.grid(row=6, column=1, padx=5, pady=5, sticky=tk.W)
-        status_combobox.set(order[8])
+        status_combobox.set(order["status"])
         
         ttk.Label(dialog, text="Price per gram (KWD):").grid(row=7, column=0, padx=5, pady=5, sticky=tk.E)
         price_entry = ttk.Entry(dialog)
         price_entry.grid(row=7, column=1, padx=5, pady=5, sticky=tk.W)
-        if order[9]:  # If price exists
-            price_entry.insert(0, order[9])
+        if order["price_per_gm"]:  # If price exists
+            price_entry.insert(0, order["price_per_gm"])
         
         ttk.Label(dialog, text="Making charges (KWD):").grid(row=8, column=0, padx=5, pady=5, sticky=tk.E)
         making_charges_entry = ttk.Entry(dialog)
         making_charges_entry.grid(row=8, column=1, padx=5, pady=5, sticky=tk.W)
-        if order[10]:  # If making charges exist
-            making_charges_entry.insert(0, order[10])
+        if order["making_charges"]:  # If making charges exist
+            making_charges_entry.insert(0, order["making_charges"])
         
         # Items section
         items = []
@@ -945,7 +1347,8 @@ class GoldShopApp:
         btn_frame = ttk.Frame(dialog)
         btn_frame.grid(row=9, column=0, columnspan=2, pady=10)
         
-        ttk.Button(btn_frame, text="Update", command=lambda: self.update_order(
+        update_btn = ttk.Button(btn_frame, text="Update")
+        update_btn.configure(command=lambda: self._submit_once(update_btn, lambda: self.update_order(
             order_id,
             client_var.get(),
             desc_entry.get(),
@@ -958,7 +1361,8 @@ class GoldShopApp:
             making_charges_entry.get(),
             items,
             dialog
-        )).pack(side=tk.LEFT, padx=5)
+        )))
+        update_btn.pack(side=tk.LEFT, padx=5)
         
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
     
@@ -968,40 +1372,40 @@ class GoldShopApp:
             # Extract client ID from combobox text
             client_id = int(client.split("(ID:")[1].rstrip(")"))
             
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            # Convert empty actual weight to NULL
-            actual_weight = float(actual_weight) if actual_weight else None
-            price_per_gm = float(price_per_gm) if price_per_gm else None
-            making_charges = float(making_charges) if making_charges else None
-            
-            c.execute('''UPDATE orders SET
-                        client_id = ?,
-                        description = ?,
-                        estimated_weight = ?,
-                        actual_weight = ?,
-                        purity = ?,
-                        delivery_date = ?,
-                        status = ?,
-                        price_per_gm = ?,
-                        making_charges = ?
-                        WHERE id = ?''',
-                    (client_id, description, float(est_weight), actual_weight, 
-                     float(purity), delivery_date, status, 
-                     price_per_gm, making_charges, order_id))
+            # Parse every number once, before touching the database;
+            # an empty actual weight becomes NULL
+            est_weight = float(est_weight)
+            actual_weight = self._optional_float(actual_weight)
+            purity = float(purity)
+            price_per_gm = self._optional_float(price_per_gm)
+            making_charges = self._optional_float(making_charges)
+            item_rows = [(order_id, desc, float(weight), float(item_purity), float(rate), float(amount))
+                         for desc, weight, item_purity, rate, amount in items]
             
-            # Delete existing order items
-            c.execute("DELETE FROM order_items WHERE order_id = ?", (order_id,))
-            
-            # Insert new order items
-            for item in items:
-                c.execute('''INSERT INTO order_items (order_id, description, weight, purity, rate, amount)
-                            VALUES (?, ?, ?, ?, ?, ?)''',
-                          (order_id, item[0], float(item[1]), float(item[2]), float(item[3]), float(item[4])))
+            with self.conn:
+                c = self.conn.cursor()
+                c.execute('''UPDATE orders SET
+                            client_id = ?,
+                            description = ?,
+                            estimated_weight = ?,
+                            actual_weight = ?,
+                            purity = ?,
+                            delivery_date = ?,
+                            status = ?,
+                            price_per_gm = ?,
+                            making_charges = ?
+                            WHERE id = ?''',
+                        (client_id, description, est_weight, actual_weight, 
+                         purity, delivery_date, status, 
+                         price_per_gm, making_charges, order_id))
+                
+                # Delete existing order items
+                c.execute("DELETE FROM order_items WHERE order_id = ?", (order_id,))
+                
+                # Insert new order items
+                self._chunked_insert(c, "order_items", self._ORDER_ITEM_COLUMNS, item_rows)
 
-            conn.commit()
-            conn.close()
+            self._mark_dirty("orders")
             
             messagebox.showinfo("Success", "Order updated successfully!")
             dialog.destroy()
@@ -1022,14 +1426,15 @@ class GoldShopApp:
         
         if messagebox.askyesno("Confirm", "Are you sure you want to delete this order?"):
             try:
-                conn = sqlite3.connect(self.db_path)
-                c = conn.cursor()
-                c.execute("DELETE FROM orders WHERE id = ?", (order_id,))
-                conn.commit()
-                conn.close()
+                with self.conn:
+                    c = self.conn.cursor()
+                    c.execute("DELETE FROM order_items WHERE order_id = ?", (order_id,))
+                    c.execute("DELETE FROM orders WHERE id = ?", (order_id,))
+                
+                self._mark_dirty("orders")
                 
                 messagebox.showinfo("Success", "Order deleted successfully!")
-                self.load_orders()
+                self._remove_tree_row(self.orders_tree, selected[0])
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete order: {str(e)}")
     
@@ -1045,11 +1450,16 @@ class GoldShopApp:
     
     def generate_invoice(self, order_id):
         """Generate PDF invoice for an order"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        # Get order details
-        c.execute('''SELECT orders.*, clients.name, clients.phone, clients.address
+        c = self.conn.cursor()
+        c.row_factory = sqlite3.Row
+        
+        # Get order details, the invoice total and the items as a JSON array
+        # in one round trip
+        c.execute('''SELECT orders.*, clients.name, clients.phone, clients.address,
+                     (SELECT COALESCE(SUM(amount), 0) FROM order_items WHERE order_id = orders.id)
+                     + COALESCE(orders.making_charges, 0) AS total,
+                     (SELECT json_group_array(json_array(description, weight, purity, rate, amount))
+                      FROM (SELECT * FROM order_items WHERE order_id = orders.id ORDER BY id)) AS items_json
                      FROM orders
                      LEFT JOIN clients ON orders.client_id = clients.id
                      WHERE orders.id = ?''', (order_id,))
@@ -1059,106 +1469,94 @@ class GoldShopApp:
             messagebox.showerror("Error", "Order not found")
             return
         
+        # Lay out and write the PDF off the Tk thread
+        self._render_in_background(self._build_invoice, "Invoice generated", "invoice", order)
+    
+    def _build_invoice(self, order):
+        """Write the invoice PDF for an order row and return its path"""
+        items = json.loads(order["items_json"])
+        
         # Create PDF
         pdf = FPDF()
         pdf.add_page()
-        pdf.set_font("Arial", size=12)
+        pdf.set_font("Helvetica", size=12)
         
         # Header
-        pdf.cell(200, 10,  txt="BARKAT AL KHAIR", ln=1, align='C')
+        pdf.cell(200, 10,  text="BARKAT AL KHAIR", align='C', new_x="LMARGIN", new_y="NEXT")
         pdf.ln(10)
         
         # Invoice info
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(50, 10, txt="Invoice #:", ln=0)
-        pdf.set_font("Arial", size=12)
-        pdf.cell(0, 10, txt=f"ORD-{order[0]:04d}", ln=1)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(50, 10, txt="Date:", ln=0)
-        pdf.set_font("Arial", size=12)
-        pdf.cell(0, 10, txt=datetime.now().strftime("%Y-%m-%d"), ln=1)
+        pdf.set_font("Helvetica", 'B', 12)
+        pdf.cell(50, 10, text="Invoice #:")
+        pdf.set_font("Helvetica", size=12)
+        pdf.cell(0, 10, text=f"ORD-{order['id']:04d}", new_x="LMARGIN", new_y="NEXT")
+        
+        pdf.set_font("Helvetica", 'B', 12)
+        pdf.cell(50, 10, text="Date:")
+        pdf.set_font("Helvetica", size=12)
+        pdf.cell(0, 10, text=self._today(), new_x="LMARGIN", new_y="NEXT")
         pdf.ln(5)
         
         # Client info
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(200, 10, txt="Information", ln=1)
-        pdf.set_font("Arial", size=10)
-        pdf.cell(200, 10, txt=f"Name: {order[11]}", ln=1)
-        pdf.cell(200, 10, txt=f"Phone: {order[12]}", ln=1)
-        pdf.cell(200, 10, txt=f"Address: {order[13]}", ln=1)
+        pdf.set_font("Helvetica", 'B', 12)
+        pdf.cell(200, 10, text="Information", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("Helvetica", size=10)
+        pdf.cell(200, 10, text=f"Name: {order['name']}", new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(200, 10, text=f"Phone: {order['phone']}", new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(200, 10, text=f"Address: {order['address']}", new_x="LMARGIN", new_y="NEXT")
         pdf.ln(10)
         
         # Order details
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(200, 10, txt="Order Details", ln=1)
-        pdf.set_font("Arial", size=10)
+        pdf.set_font("Helvetica", 'B', 12)
+        pdf.cell(200, 10, text="Order Details", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("Helvetica", size=10)
         
-        pdf.cell(50, 10, txt="Description:", ln=0)
-        pdf.cell(0, 10, txt=order[2], ln=1)
+        pdf.cell(50, 10, text="Description:")
+        pdf.cell(0, 10, text=order["description"], new_x="LMARGIN", new_y="NEXT")
         
-        pdf.cell(50, 10, txt="Delivery Date:", ln=0)
-        pdf.cell(0, 10, txt=order[7], ln=1)
+        pdf.cell(50, 10, text="Delivery Date:")
+        pdf.cell(0, 10, text=order["delivery_date"], new_x="LMARGIN", new_y="NEXT")
         
-        pdf.cell(50, 10, txt="Status:", ln=0)
-        pdf.cell(0, 10, txt=order[8], ln=1)
+        pdf.cell(50, 10, text="Status:")
+        pdf.cell(0, 10, text=order["status"], new_x="LMARGIN", new_y="NEXT")
         pdf.ln(10)
     
         # Items table
-        # pdf.set_font("Arial", 'B', 12)
-        # pdf.cell(200, 10, "Items", ln=1)
-    
-        # pdf.set_font("Arial", 'B', 10)
-        # pdf.cell(70, 10, "Description", 1, 0, 'C')
-        # pdf.cell(30, 10, "Weight (g)", 1, 0, 'C')
-        # pdf.cell(30, 10, "Purity", 1, 0, 'C')
-        # pdf.cell(30, 10, "Rate (KWD/g)", 1, 0, 'C')
-        # pdf.cell(30, 10, "Amount (KWD)", 1, 1, 'C')
-        
-        pdf.set_font("Arial", size=10)
-        # Fetch all items for this order
-        c.execute('''SELECT description, weight, purity, rate, amount FROM order_items WHERE order_id = ?''', (order_id,))
-        items = c.fetchall()
-
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(200, 10, "Items", ln=1)
-        pdf.set_font("Arial", 'B', 10)
-        pdf.cell(70, 10, "Description", 1, 0, 'C')
-        pdf.cell(30, 10, "Weight (g)", 1, 0, 'C')
-        pdf.cell(30, 10, "Purity", 1, 0, 'C')
-        pdf.cell(30, 10, "Rate (KWD/g)", 1, 0, 'C')
-        pdf.cell(30, 10, "Amount (KWD)", 1, 1, 'C')
-        pdf.set_font("Arial", size=10)
-        for desc, weight, purity, rate, amount in items:
-            pdf.cell(70, 10, str(desc), 1, 0)
-            pdf.cell(30, 10, f"{weight:.2f}", 1, 0, 'R')
-            pdf.cell(30, 10, f"{purity:.3f}", 1, 0, 'R')
-            pdf.cell(30, 10, f"{rate:.2f}", 1, 0, 'R')
-            pdf.cell(30, 10, f"{amount:,.2f}", 1, 1, 'R')
-        
-        # Calculate total amount from all items
-        items_total = sum(item[4] for item in items)  # item[4] is amount
-
+        # pdf.set_font("Helvetica", 'B', 12)
+        # pdf.cell(200, 10, "Items", new_x="LMARGIN", new_y="NEXT")
+    
+        # pdf.set_font("Helvetica", 'B', 10)
+        # pdf.cell(70, 10, "Description", 1, align='C')
+        # pdf.cell(30, 10, "Weight (g)", 1, align='C')
+        # pdf.cell(30, 10, "Purity", 1, align='C')
+        # pdf.cell(30, 10, "Rate (KWD/g)", 1, align='C')
+        # pdf.cell(30, 10, "Amount (KWD)", 1, align='C', new_x="LMARGIN", new_y="NEXT")
+        
+        pdf.set_font("Helvetica", 'B', 12)
+        pdf.cell(200, 10, "Items", new_x="LMARGIN", new_y="NEXT")
+        rows = [(str(desc), f"{weight:.2f}", f"{purity:.3f}", f"{rate:.2f}", f"{amount:,.2f}")
+                for desc, weight, purity, rate, amount in items]
+        self._pdf_table(pdf, (70, 30, 30, 30, 30),
+                        ("Description", "Weight (g)", "Purity", "Rate (KWD/g)", "Amount (KWD)"), rows,
+                        font_size=10, header_align='C', aligns=('L', 'R', 'R', 'R', 'R'))
+        
         # Making charges
-        if order[10]:  # If making charges exist
-            pdf.cell(160, 10, "Making Charges:", 1, 0, 'R')
-            pdf.cell(30, 10, f"{order[10]:,.2f}", 1, 1, 'R')
+        if order["making_charges"]:  # If making charges exist
+            pdf.cell(160, 10, "Making Charges:", 1, align='R')
+            pdf.cell(30, 10, f"{order['making_charges']:,.2f}", 1, align='R', new_x="LMARGIN", new_y="NEXT")
         
-        # Total
-        total = items_total + (order[10] if order[10] else 0)
-        pdf.set_font("Arial", 'B', 10)
-        pdf.cell(160, 10, "TOTAL:", 1, 0, 'R')
-        pdf.cell(30, 10, f"{total:,.2f}", 1, 1, 'R')
+        # Total of all items plus making charges, summed by SQLite
+        total = order["total"]
+        pdf.set_font("Helvetica", 'B', 10)
+        pdf.cell(160, 10, "TOTAL:", 1, align='R')
+        pdf.cell(30, 10, f"{total:,.2f}", 1, align='R', new_x="LMARGIN", new_y="NEXT")
         
         
         
         # Save the PDF
-        invoice_path = f"invoice_ORD-{order[0]:04d}.pdf"
-        pdf.output(invoice_path)
-        
-        # Show success message
-        messagebox.showinfo("Success", f"Invoice generated:\n{os.path.abspath(invoice_path)}")
-        webbrowser.open(invoice_path)
+        invoice_path = f"invoice_ORD-{order['id']:04d}.pdf"
+        self._write_pdf(pdf, invoice_path)
+        return invoice_path
     
     def build_inventory_tab(self):
         """Build the inventory management tab"""
@@ -1198,23 +1596,14 @@ class GoldShopApp:
         
         # Add scrollbar
         scrollbar = ttk.Scrollbar(self.inventory_tab, orient=tk.VERTICAL, command=self.inventory_tree.yview)
-        self.inventory_tree.configure(yscrollcommand=scrollbar.set)
+        self.inventory_tree.configure(yscrollcommand=lambda first, last: self._on_paged_tree_scroll(
+            self.inventory_tree, scrollbar, first, last))
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.inventory_tree.pack(fill=tk.BOTH, expand=True)
     
     def load_inventory(self):
         """Load inventory transactions from database"""
-        self.inventory_tree.delete(*self.inventory_tree.get_children())
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''SELECT inventory.id, inventory.transaction_type, inventory.weight, inventory.purity, 
-                        inventory.price_per_gm, inventory.date, inventory.notes, clients.name
-                 FROM inventory
-                 LEFT JOIN clients ON inventory.client_id = clients.id
-                 ORDER BY inventory.date DESC''')
-        for row in c.fetchall():
-            self.inventory_tree.insert("", tk.END, values=row)
-        conn.close()
+        self._load_paged_tree(self.inventory_tree, self._SQL_LOAD_INVENTORY)
     
     def add_inventory(self, transaction_type):
         """Add inventory transaction (received/issued gold)"""
@@ -1229,12 +1618,7 @@ class GoldShopApp:
         client_combobox.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W)
 
         # Get client names for combobox
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT id, name FROM clients ORDER BY name")
-        clients = c.fetchall()
-        client_combobox['values'] = [f"{name} (ID:{id})" for id, name in clients]
-        conn.close()
+        client_combobox['values'] = self._clients_labels()
 
         ttk.Label(dialog, text="Weight (grams):").grid(row=1, column=0, padx=5, pady=5, sticky=tk.E)
         weight_entry = ttk.Entry(dialog)
@@ -1252,7 +1636,7 @@ class GoldShopApp:
         ttk.Label(dialog, text="Date:").grid(row=4, column=0, padx=5, pady=5, sticky=tk.E)
         date_entry = ttk.Entry(dialog)
         date_entry.grid(row=4, column=1, padx=5, pady=5, sticky=tk.W)
-        date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        date_entry.insert(0, self._today())
         
         ttk.Label(dialog, text="Notes:").grid(row=5, column=0, padx=5, pady=5, sticky=tk.E)
         notes_entry = ttk.Entry(dialog, width=40)
@@ -1262,7 +1646,8 @@ class GoldShopApp:
         btn_frame = ttk.Frame(dialog)
         btn_frame.grid(row=6, column=0, columnspan=2, pady=10)
 
-        ttk.Button(btn_frame, text="Save", command=lambda: self.save_inventory(
+        save_btn = ttk.Button(btn_frame, text="Save")
+        save_btn.configure(command=lambda: self._submit_once(save_btn, lambda: self.save_inventory(
             transaction_type,
             client_var.get(),
             weight_entry.get(),
@@ -1271,7 +1656,8 @@ class GoldShopApp:
             date_entry.get(),
             notes_entry.get(),
             dialog
-        )).pack(side=tk.LEFT, padx=5)
+        )))
+        save_btn.pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
     
     def save_inventory(self, transaction_type, client, weight, purity, price, date, notes, dialog):
@@ -1286,26 +1672,38 @@ class GoldShopApp:
                 messagebox.showerror("Error", "Please select a client for issued gold.")
                 return
 
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
+            with self.conn:
+                c = self.conn.cursor()
 
-            c.execute('''INSERT INTO inventory 
-                        (transaction_type, weight, purity, price_per_gm, date, notes, client_id)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                    (transaction_type, float(weight), float(purity), 
-                     float(price) if price else None, date, notes, client_id))
+                c.execute('''INSERT INTO inventory 
+                            (transaction_type, weight, purity, price_per_gm, date, notes, client_id)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                        (transaction_type, float(weight), float(purity), 
+                         float(price) if price else None, date, notes, client_id))
 
-            conn.commit()
-            conn.close()
+            self._mark_dirty("inventory")
 
             messagebox.showinfo("Success", "Inventory transaction added successfully!")
             dialog.destroy()
-            self.load_inventory()
+            self._show_new_inventory(c.lastrowid)
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {str(e)}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save transaction: {str(e)}")
     
+    def _show_new_inventory(self, transaction_id):
+        """Add a just-saved transaction to the top of the inventory list"""
+        c = self.conn.cursor()
+        c.execute(self._SQL_INVENTORY_ROW, (transaction_id,))
+        row = c.fetchone()
+        top = self.inventory_tree.get_children()
+        if top and str(row[5]) < self.inventory_tree.item(top[0], "values")[5]:
+            # A back-dated entry sorts below rows already shown, possibly past
+            # the loaded pages, so reload rather than shift the page offset
+            self.load_inventory()
+        else:
+            self._prepend_tree_row(self.inventory_tree, row)
+    
     def delete_inventory(self):
         """Delete selected inventory transaction"""
         selected = self.inventory_tree.selection()
@@ -1317,14 +1715,14 @@ class GoldShopApp:
         
         if messagebox.askyesno("Confirm", "Are you sure you want to delete this transaction?"):
             try:
-                conn = sqlite3.connect(self.db_path)
-                c = conn.cursor()
-                c.execute("DELETE FROM inventory WHERE id = ?", (transaction_id,))
-                conn.commit()
-                conn.close()
+                with self.conn:
+                    c = self.conn.cursor()
+                    c.execute("DELETE FROM inventory WHERE id = ?", (transaction_id,))
+                
+                self._mark_dirty("inventory")
                 
                 messagebox.showinfo("Success", "Transaction deleted successfully!")
-                self.load_inventory()
+                self._remove_tree_row(self.inventory_tree, selected[0])
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete transaction: {str(e)}")
     
@@ -1348,7 +1746,7 @@ class GoldShopApp:
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=5)
         self.client_search_entry = ttk.Entry(search_frame, width=30)
         self.client_search_entry.pack(side=tk.LEFT, padx=5)
-        self.client_search_entry.bind("<KeyRelease>", lambda e: self.search_clients())
+        self.client_search_entry.bind("<KeyRelease>", self.on_client_search_key)
         
         ttk.Button(search_frame, text="Clear", command=self.clear_client_search).pack(side=tk.LEFT, padx=5)
         
@@ -1375,46 +1773,60 @@ class GoldShopApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.clients_tree.pack(fill=tk.BOTH, expand=True)
     
+    def on_client_search_key(self, event):
+        """Run the client search 150 ms after the last keystroke that changed the term"""
+        if self._client_search_after:
+            self.root.after_cancel(self._client_search_after)
+            self._client_search_after = None
+        if self.client_search_entry.get().strip() == self._client_search_shown:
+            # Arrow keys, modifiers, or typing back to the term already shown
+            return
+        self._client_search_after = self.root.after(150, self.search_clients)
+    
     def search_clients(self):
         """Search clients based on search term"""
+        self._client_search_after = None
         search_term = self.client_search_entry.get().strip()
         if not search_term:
             self.load_clients()
             return
         
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        query = '''SELECT * FROM clients 
-                  WHERE name LIKE ? OR phone LIKE ? OR address LIKE ?
-                  ORDER BY name'''
-        
-        search_param = f"%{search_term}%"
-        c.execute(query, (search_param, search_param, search_param))
-        
-        self.clients_tree.delete(*self.clients_tree.get_children())
-        for row in c.fetchall():
-            self.clients_tree.insert("", tk.END, values=row)
-        
-        conn.close()
+        if len(search_term) < 3:
+            # Too short to narrow much as a substring; match name prefixes,
+            # which idx_clients_name_nocase turns into an index range scan
+            query, params = self._SQL_SEARCH_CLIENTS_PREFIX, (f"{search_term}%",)
+        elif self.has_clients_fts:
+            # The quoted phrase matches the term anywhere in name, phone or
+            # address, like the LIKE search
+            phrase = '"' + search_term.replace('"', '""') + '"'
+            query, params = self._SQL_SEARCH_CLIENTS_FTS, (phrase,)
+        else:
+            search_param = f"%{search_term}%"
+            query, params = self._SQL_SEARCH_CLIENTS, (search_param, search_param, search_param)
+        
+        # The worker runs requests in order, so the last search queued wins
+        self._client_search_shown = search_term
+        self._query_in_background(query, params, lambda rows: self._fill_tree(self.clients_tree, rows))
     
     def clear_client_search(self):
         """Clear client search and reload all clients"""
+        if self._client_search_after:
+            # Drop a search still pending from the last keystroke
+            self.root.after_cancel(self._client_search_after)
+            self._client_search_after = None
         self.client_search_entry.delete(0, tk.END)
         self.load_clients()
     
     def load_clients(self):
         """Load clients from database"""
-        self.clients_tree.delete(*self.clients_tree.get_children())
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        c.execute("SELECT * FROM clients ORDER BY name")
-        
-        for row in c.fetchall():
-            self.clients_tree.insert("", tk.END, values=row)
-        
-        conn.close()
+        self._client_search_shown = ""
+        self._query_in_background(self._SQL_LOAD_CLIENTS, (), self._show_all_clients)
+    
+    def _show_all_clients(self, rows):
+        """Fill the clients tab with the full client list"""
+        # Refresh the client pickers' cache from the full list
+        self._clients_cache = [(row[0], row[1], f"{row[1]} (ID:{row[0]})") for row in rows]
+        self._fill_tree(self.clients_tree, rows)
     
     def add_client(self):
         """Add new client"""
@@ -1438,12 +1850,14 @@ class GoldShopApp:
         btn_frame = ttk.Frame(dialog)
         btn_frame.grid(row=3, column=0, columnspan=2, pady=10)
         
-        ttk.Button(btn_frame, text="Save", command=lambda: self.save_client(
+        save_btn = ttk.Button(btn_frame, text="Save")
+        save_btn.configure(command=lambda: self._submit_once(save_btn, lambda: self.save_client(
             name_entry.get(),
             phone_entry.get(),
             address_entry.get(),
             dialog
-        )).pack(side=tk.LEFT, padx=5)
+        )))
+        save_btn.pack(side=tk.LEFT, padx=5)
         
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
     
@@ -1454,16 +1868,10 @@ class GoldShopApp:
             return
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            c.execute('''INSERT INTO clients 
-                        (name, phone, address, created_date)
-                        VALUES (?, ?, ?, ?)''',
-                    (name, phone, address, datetime.now().strftime("%Y-%m-%d")))
+            with self.conn:
+                self.conn.execute(self._SQL_INSERT_CLIENT, (name, phone, address, self._today()))
             
-            conn.commit()
-            conn.close()
+            self._mark_dirty("clients")
             
             messagebox.showinfo("Success", "Client added successfully!")
             dialog.destroy()
@@ -1481,11 +1889,7 @@ class GoldShopApp:
         client_id = self.clients_tree.item(selected[0], "values")[0]
         
         # Fetch client details
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT * FROM clients WHERE id = ?", (client_id,))
-        client = c.fetchone()
-        conn.close()
+        client = self.conn.execute(self._SQL_CLIENT_BY_ID, (client_id,)).fetchone()
         
         if not client:
             messagebox.showerror("Error", "Client not found")
@@ -1515,13 +1919,15 @@ class GoldShopApp:
         btn_frame = ttk.Frame(dialog)
         btn_frame.grid(row=3, column=0, columnspan=2, pady=10)
         
-        ttk.Button(btn_frame, text="Update", command=lambda: self.update_client(
+        update_btn = ttk.Button(btn_frame, text="Update")
+        update_btn.configure(command=lambda: self._submit_once(update_btn, lambda: self.update_client(
             client_id,
             name_entry.get(),
             phone_entry.get(),
             address_entry.get(),
             dialog
-        )).pack(side=tk.LEFT, padx=5)
+        )))
+        update_btn.pack(side=tk.LEFT, padx=5)
         
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
     
@@ -1532,18 +1938,10 @@ class GoldShopApp:
             return
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            c.execute('''UPDATE clients SET
-                        name = ?,
-                        phone = ?,
-                        address = ?
-                        WHERE id = ?''',
-                    (name, phone, address, client_id))
+            with self.conn:
+                self.conn.execute(self._SQL_UPDATE_CLIENT, (name, phone, address, client_id))
             
-            conn.commit()
-            conn.close()
+            self._mark_dirty("clients")
             
             messagebox.showinfo("Success", "Client updated successfully!")
             dialog.destroy()
@@ -1560,24 +1958,24 @@ class GoldShopApp:
         
         client_id = self.clients_tree.item(selected[0], "values")[0]
         
-        # Check if client has orders
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT COUNT(*) FROM orders WHERE client_id = ?", (client_id,))
-        order_count = c.fetchone()[0]
-        conn.close()
+        # Check if client has orders; stops at the first one found
+        has_orders = self.conn.execute(self._SQL_CLIENT_HAS_ORDERS, (client_id,)).fetchone() is not None
         
-        if order_count > 0:
+        if has_orders:
             messagebox.showerror("Error", "Cannot delete client with existing orders")
             return
         
+        # Inventory transactions reference the client too, and foreign keys are enforced
+        if self.conn.execute(self._SQL_CLIENT_HAS_INVENTORY, (client_id,)).fetchone() is not None:
+            messagebox.showerror("Error", "Cannot delete client with existing inventory transactions")
+            return
+        
         if messagebox.askyesno("Confirm", "Are you sure you want to delete this client?"):
             try:
-                conn = sqlite3.connect(self.db_path)
-                c = conn.cursor()
-                c.execute("DELETE FROM clients WHERE id = ?", (client_id,))
-                conn.commit()
-                conn.close()
+                with self.conn:
+                    self.conn.execute(self._SQL_DELETE_CLIENT, (client_id,))
+                
+                self._mark_dirty("clients")
                 
                 messagebox.showinfo("Success", "Client deleted successfully!")
                 self.load_clients()
@@ -1631,14 +2029,7 @@ class GoldShopApp:
         order_tree.grid(row=1, column=0, padx=5, pady=5, sticky=tk.NSEW)
         
         # Load orders
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''SELECT orders.id, clients.name, orders.description, orders.order_date
-                     FROM orders LEFT JOIN clients ON orders.client_id = clients.id
-                     ORDER BY orders.order_date DESC''')
-        for row in c.fetchall():
-            order_tree.insert("", tk.END, values=row)
-        conn.close()
+        self._fill_tree(order_tree, self._get_invoice_orders())
         
         # Buttons
         btn_frame = ttk.Frame(dialog)
@@ -1648,6 +2039,15 @@ class GoldShopApp:
                   command=lambda: self.generate_invoice_from_dialog(order_tree, dialog)).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
     
+    def _get_invoice_orders(self):
+        """Return the invoice dialog's order rows, re-querying only after a write"""
+        # data_version moves when another connection commits; total_changes
+        # counts the rows this connection has written itself
+        version = (self.conn.execute("PRAGMA data_version").fetchone()[0], self.conn.total_changes)
+        if self._invoice_orders_cache is None or self._invoice_orders_cache[0] != version:
+            self._invoice_orders_cache = (version, self.conn.execute(self._SQL_INVOICE_ORDERS).fetchall())
+        return self._invoice_orders_cache[1]
+    
     def generate_invoice_from_dialog(self, order_tree, dialog):
         """Generate invoice from dialog selection"""
         selected = order_tree.selection()
@@ -1674,74 +2074,76 @@ class GoldShopApp:
             return
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            # Clear existing data
-            c.execute("DELETE FROM orders")
-            c.execute("DELETE FROM clients")
-            c.execute("DELETE FROM inventory")
-            c.execute("DELETE FROM rates")
-            
-            # Add sample rates
-            c.execute("INSERT INTO rates (date, gold_rate, silver_rate) VALUES (?, ?, ?)",
-                     (datetime.now().strftime("%Y-%m-%d"), 5000, 60))
-            
-            # Add sample clients
-            sample_clients = [
-                ("John Smith", "555-0101", "123 Main St"),
-                ("Emma Johnson", "555-0102", "456 Oak Ave"),
-                ("Michael Brown", "555-0103", "789 Pine Rd")
-            ]
-            
-            for name, phone, address in sample_clients:
-                c.execute('''INSERT INTO clients 
-                            (name, phone, address, created_date)
-                            VALUES (?, ?, ?, ?)''',
-                        (name, phone, address, datetime.now().strftime("%Y-%m-%d")))
-            
-            # Add sample inventory
-            sample_inventory = [
-                ("received", 100.5, 0.999, datetime.now().strftime("%Y-%m-%d"), "Initial stock", 4800),
-                ("issued", 25.2, 0.999, datetime.now().strftime("%Y-%m-%d"), "For order #1", 5000),
-                ("received", 50.0, 0.999, datetime.now().strftime("%Y-%m-%d"), "New purchase", 4900)
-            ]
-            
-            for trans_type, weight, purity, date, notes, price in sample_inventory:
-                c.execute('''INSERT INTO inventory 
-                            (transaction_type, weight, purity, date, notes, price_per_gm)
-                            VALUES (?, ?, ?, ?, ?, ?)''',
-                        (trans_type, weight, purity, date, notes, price))
+            # One timestamp for every sample row
+            now = datetime.now()
+            today = now.strftime("%Y-%m-%d")
             
-            # Add sample orders
-            c.execute("SELECT id FROM clients ORDER BY id")
-            client_ids = [row[0] for row in c.fetchall()]
-            
-            sample_orders = [
-                (client_ids[0], "Gold chain", 15.5, 15.3, 0.999, 
-                 datetime.now().strftime("%Y-%m-%d"), 
-                 (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d"), 
-                 "Completed", 5000, 1500),
-                (client_ids[1], "Gold ring", 8.2, 8.1, 0.999, 
-                 datetime.now().strftime("%Y-%m-%d"), 
-                 (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d"), 
-                 "In Progress", 5000, 800),
-                (client_ids[2], "Gold bracelet", 22.0, None, 0.999, 
-                 datetime.now().strftime("%Y-%m-%d"), 
-                 (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d"), 
-                 "Pending", 5000,   1200)
+            with self.conn:
+                c = self.conn.cursor()
+                
+                # Clear existing data (children before the clients they reference)
+                c.execute("DELETE FROM order_items")
+                c.execute("DELETE FROM orders")
+                c.execute("DELETE FROM inventory")
+                c.execute("DELETE FROM clients")
+                c.execute("DELETE FROM rates")
+                
+                # Add sample rates
+                c.execute("INSERT INTO rates (date, gold_rate, silver_rate) VALUES (?, ?, ?)",
+                         (today, 5000, 60))
+                
+                # Add sample clients
+                sample_clients = [
+                    ("John Smith", "555-0101", "123 Main St"),
+                    ("Emma Johnson", "555-0102", "456 Oak Ave"),
+                    ("Michael Brown", "555-0103", "789 Pine Rd")
+                ]
+                
+                # Keep each new id so the sample orders can reference them
+                client_ids = []
+                for name, phone, address in sample_clients:
+                    c.execute('''INSERT INTO clients 
+                                (name, phone, address, created_date)
+                                VALUES (?, ?, ?, ?)''',
+                            (name, phone, address, today))
+                    client_ids.append(c.lastrowid)
+                
+                # Add sample inventory
+                sample_inventory = [
+                    ("received", 100.5, 0.999, today, "Initial stock", 4800),
+                    ("issued", 25.2, 0.999, today, "For order #1", 5000),
+                    ("received", 50.0, 0.999, today, "New purchase", 4900)
+                ]
+                
+                c.executemany('''INSERT INTO inventory 
+                                 (transaction_type, weight, purity, date, notes, price_per_gm)
+                                 VALUES (?, ?, ?, ?, ?, ?)''',
+                              sample_inventory)
+                
+                # Add sample orders
+                sample_orders = [
+                    (client_ids[0], "Gold chain", 15.5, 15.3, 0.999, 
+                     today, 
+                     (now + timedelta(days=7)).strftime("%Y-%m-%d"), 
+                     "Completed", 5000, 1500),
+                    (client_ids[1], "Gold ring", 8.2, 8.1, 0.999, 
+                     today, 
+                     (now + timedelta(days=5)).strftime("%Y-%m-%d"), 
+                     "In Progress", 5000, 800),
+                    (client_ids[2], "Gold bracelet", 22.0, None, 0.999, 
+                     today, 
+                     (now + timedelta(days=10)).strftime("%Y-%m-%d"), 
+                     "Pending", 5000,   1200)
 
-            ]
-            
-            for client_id, desc, est, act, purity, order_date, delivery, status, price, charges in sample_orders:
-                c.execute('''INSERT INTO orders 
-                            (client_id, description, estimated_weight, actual_weight, purity, 
-                             order_date, delivery_date, status, price_per_gm, making_charges)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                        (client_id, desc, est, act, purity, order_date, delivery, status, price, charges))
+                ]
+                
+                c.executemany('''INSERT INTO orders 
+                                 (client_id, description, estimated_weight, actual_weight, purity, 
+                                  order_date, delivery_date, status, price_per_gm, making_charges)
+                                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                              sample_orders)
             
-            conn.commit()
-            conn.close()
+            self._mark_dirty("orders", "inventory", "clients", "rates")
             
             messagebox.showinfo("Success", "Sample data generated successfully!")
             self.load_orders()